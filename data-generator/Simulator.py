@@ -1,14 +1,50 @@
 from faker import Faker
-import random
+import asyncio
+import multiprocessing
+import signal
 import time
+import numpy as np
 import pymongo
+from pymongo import InsertOne
+from bson import encode
+from bson.raw_bson import RawBSONDocument
 import os
 from load_dotenv import load_dotenv
-from datetime import datetime
-from logger_utility import setup_logger # Import the new logging utility
+from datetime import datetime, timedelta
+from uuid import uuid4
+from logger_utility import setup_logger, get_log_queue, setup_worker_logger # Import the new logging utility
+
+# Initialize Faker for synthetic data generation, loading only the providers the simulator uses
+fake = Faker(providers=[
+    "faker.providers.person",
+    "faker.providers.address",
+])
+
+# Pre-bound generator methods so the hot path skips Faker's dynamic provider lookup
+_fake_name = fake.name
+_fake_state = fake.state_abbr
+
+# Category values, materialised once and sampled by index in generate_batch
+_POLICY_TYPES = ("Auto", "Home", "Health")
+_CLAIM_TYPES = ("Accident", "Theft", "Fire", "Liability")
+
+# NumPy generator for the vectorised numeric fields in generate_batch
+_rng = np.random.default_rng()
+
+# Claim dates fall within the year before today; precompute every candidate ISO
+# date once a day instead of having Faker parse '-1y'/'today' on every record
+_SPAN = 365
+
+def _claim_dates_until(today):
+    """
+    Returns the ISO dates from `_SPAN` days before `today` up to `today`, oldest first.
+    """
+    start = today - timedelta(days=_SPAN)
+    return tuple((start + timedelta(days=offset)).isoformat() for offset in range(_SPAN + 1))
+
+_TODAY = datetime.now().date()
+_CLAIM_DATES = _claim_dates_until(_TODAY)
 
-# Initialize Faker for synthetic data generation
-fake = Faker()
 # Global logger instance (will be initialized in __main__)
 logger = None 
 
@@ -17,7 +53,7 @@ def load_configuration():
     Loads environment variables from the .env file and performs basic validation.
     
     Returns:
-        tuple: (mongo_uri, sleep_time, db_name)
+        tuple: (mongo_uri, target_rate, db_name, batch_size, concurrency, workers, max_pool, min_pool, write_concern)
     """
     load_dotenv()
     
@@ -26,147 +62,471 @@ def load_configuration():
     db_name = os.getenv("MONGO_DB_NAME", "insurance-pipeline") 
     
     try:
-        # Default sleep time is 5 seconds if not set or invalid
-        sleep_time = int(os.getenv("SLEEP_TIME", 5))
+        # Default target rate is 0.2 customer/claim pairs per second across all workers,
+        # the original pace of one pair every 5 seconds. TARGET_RATE replaced SLEEP_TIME
+        # (seconds per pair), which is still honoured when TARGET_RATE is not set
+        sleep_time = os.getenv("SLEEP_TIME")
+        default_rate = 1 / float(sleep_time) if sleep_time and "TARGET_RATE" not in os.environ else 0.2
+        target_rate = float(os.getenv("TARGET_RATE", default_rate))
+        if target_rate <= 0:
+            raise ValueError
+    except (ValueError, ZeroDivisionError):
+        logger.warning("TARGET_RATE (or SLEEP_TIME) in .env is not a positive number. Defaulting to 0.2 records per second.")
+        target_rate = 0.2
+
+    try:
+        # Default batch size is 100 documents per insert_many call
+        batch_size = int(os.getenv("BATCH_SIZE", 100))
+        if batch_size < 1:
+            raise ValueError
+    except ValueError:
+        logger.warning("BATCH_SIZE in .env is not a positive integer. Defaulting to 100.")
+        batch_size = 100
+
+    try:
+        # Default of 10 batch writes in flight at once
+        concurrency = int(os.getenv("CONCURRENCY", 10))
+        if concurrency < 1:
+            raise ValueError
+    except ValueError:
+        logger.warning("CONCURRENCY in .env is not a positive integer. Defaulting to 10.")
+        concurrency = 10
+
+    try:
+        # Default of one producer process per CPU core
+        workers = int(os.getenv("WORKERS", os.cpu_count() or 1))
+        if workers < 1:
+            raise ValueError
+    except ValueError:
+        logger.warning("WORKERS in .env is not a positive integer. Defaulting to the CPU count.")
+        workers = os.cpu_count() or 1
+
+    try:
+        # Default cap of 1000 connections in each worker's pool
+        max_pool = int(os.getenv("MAX_POOL", 1000))
+        if max_pool < 1:
+            raise ValueError
+    except ValueError:
+        logger.warning("MAX_POOL in .env is not a positive integer. Defaulting to 1000.")
+        max_pool = 1000
+
+    try:
+        # Default of 64 connections kept open and ready
+        min_pool = int(os.getenv("MIN_POOL", 64))
+        if min_pool < 0:
+            raise ValueError
     except ValueError:
-        logger.warning("SLEEP_TIME in .env is not an integer. Defaulting to 5 seconds.")
-        sleep_time = 5
+        logger.warning("MIN_POOL in .env is not a non-negative integer. Defaulting to 64.")
+        min_pool = 64
+    if min_pool > max_pool:
+        logger.warning(f"MIN_POOL ({min_pool}) is larger than MAX_POOL ({max_pool}). Defaulting MIN_POOL to {min(64, max_pool)}.")
+        min_pool = min(64, max_pool)
+
+    # MONGO_W trades durability for throughput: 1 waits for the primary only (default),
+    # 0 sends unacknowledged writes, "majority" waits for replication
+    write_concern = os.getenv("MONGO_W", "1")
+    if write_concern.isdigit():
+        write_concern = int(write_concern)
+    elif write_concern != "majority":
+        # Anything else would be sent as a write concern tag and fail every write
+        logger.warning(f"MONGO_W in .env is not a non-negative integer or 'majority' (got '{write_concern}'). Defaulting to 1.")
+        write_concern = 1
         
     if not mongo_uri:
         logger.critical("MONGO_URI environment variable is not set. Please check your .env file.")
         raise ValueError("MONGO_URI environment variable is not set.")
         
     logger.info("Configuration loaded successfully.")
-    logger.debug(f"DB Name: {db_name}, Sleep Time: {sleep_time}s")
-    return mongo_uri, sleep_time, db_name
+    logger.debug("DB Name: %s, Target Rate: %s/s, Batch Size: %s, Concurrency: %s, Workers: %s, Pool: %s-%s, Write Concern: %s", db_name, target_rate, batch_size, concurrency, workers, min_pool, max_pool, write_concern)
+    return mongo_uri, target_rate, db_name, batch_size, concurrency, workers, max_pool, min_pool, write_concern
 
-def setup_mongo_connection(mongo_uri, db_name):
+async def setup_mongo_connection(mongo_uri, db_name, max_pool, min_pool, write_concern):
     """
-    Connects to MongoDB Atlas and returns the database object and collection objects.
+    Connects to MongoDB Atlas and returns the client and collection objects.
     
     Args:
         mongo_uri (str): The full MongoDB connection string.
         db_name (str): The name of the database to connect to.
+        max_pool (int): The maximum number of pooled connections.
+        min_pool (int): The number of pooled connections kept open and ready.
+        write_concern (int | str): The `w` write concern, a number of nodes or "majority".
         
     Returns:
-        tuple: (customers_collection, claims_collection)
+        tuple: (client, customers_collection, claims_collection)
     """
     logger.info("Attempting to connect to MongoDB Atlas...")
     try:
-        # Use server selection timeout to fail fast if connection cannot be established
-        client = pymongo.MongoClient(mongo_uri, serverSelectionTimeoutMS=5000)
+        # Use server selection timeout to fail fast if connection cannot be established.
+        # Journaling is skipped because the simulator's data is synthetic and replayable,
+        # and zstd wire compression shrinks the repetitive insert payloads.
+        # A large, pre-warmed pool keeps concurrent batch writes from queueing on connection checkout
+        client = pymongo.AsyncMongoClient(
+            mongo_uri,
+            serverSelectionTimeoutMS=5000,
+            w=write_concern,
+            journal=False,
+            maxPoolSize=max_pool,
+            minPoolSize=min_pool,
+            retryWrites=True,
+            compressors="zstd",
+        )
         
-        # The ismaster command is a quick way to verify connection and authentication
-        client.admin.command('ismaster') 
-        logger.info("Successfully connected to MongoDB Atlas.")
+        # The client connects lazily; the index creation below is the first real operation
+        # and fails fast through serverSelectionTimeoutMS. Set MONGO_HEALTHCHECK for an explicit ping
+        if os.getenv("MONGO_HEALTHCHECK"):
+            await client.admin.command('hello')
         
         db = client[db_name]
         customers_col = db["customers"]
         claims_col = db["claims"]
+
+        # Unique indexes let the server reject ID collisions instead of storing duplicates.
+        # Each is attempted separately, so duplicates in one collection don't skip the other
+        for col, field in ((customers_col, "customer_id"), (claims_col, "claim_id")):
+            try:
+                await col.create_index(field, unique=True)
+            except pymongo.errors.DuplicateKeyError as dke:
+                logger.warning(f"Could not create unique {field} index on '{col.name}' (existing data contains duplicates). Continuing without it. Error: {dke}")
+
+        # insert_batch relies on MongoClient.bulk_write, which needs MongoDB 8.0+ (wire
+        # version 25). Stop here on older servers rather than failing every batch
+        wire_version = max(
+            (server.max_wire_version or 0
+             for server in client.topology_description.server_descriptions().values()
+             if server.is_writable),
+            default=0,
+        )
+        if wire_version < 25:
+            raise pymongo.errors.ConfigurationError("The simulator requires MongoDB 8.0 or newer for client-level bulk writes.")
+        logger.info("Successfully connected to MongoDB Atlas.")
         
-        return customers_col, claims_col
+        return client, customers_col, claims_col
         
     except pymongo.errors.ConnectionFailure as e:
         logger.critical(f"Connection error: Could not connect to MongoDB Atlas. Check your MONGO_URI and network status. Error: {e}")
         raise e
+    except pymongo.errors.ConfigurationError as e:
+        logger.critical(f"Configuration error: {e}")
+        raise e
     except Exception as e:
         logger.critical(f"An unexpected critical error occurred during MongoDB connection: {e}")
         raise e
 
-def generate_insurance_data():
+def generate_batch(n, worker_id=0):
     """
-    Generates a new, simulated customer record and an associated claim record.
+    Generates `n` simulated customer records and their associated claim records.
+    
+    Amounts, fraud flags, claim dates and category fields are drawn as NumPy arrays in a few
+    vectorised calls; IDs and the Faker-backed fields are generated per record.
     
+    Each document is encoded to BSON as soon as it is built, so the bulk write
+    sends the pre-encoded bytes as-is. The server assigns the `_id` of each document.
+    
+    Args:
+        n (int): The number of customer/claim pairs to generate.
+        worker_id (int): The producer process index, embedded in the generated IDs.
+        
     Returns:
-        tuple: (customer_dict, claim_dict)
+        tuple: (customer_list, claim_list) of RawBSONDocument
     """
-    customer_id = f"CUST-{random.randint(100, 999)}"
+    # The worker prefix keeps ID spaces disjoint across processes, and 48 random
+    # bits per ID make collisions within a worker astronomically rare
+    customer_ids = [f"CUST-{worker_id}-{uuid4().hex[:12]}" for _ in range(n)]
+    claim_ids = [f"CLM-{worker_id}-{uuid4().hex[:12]}" for _ in range(n)]
+    # Index the tuples directly rather than letting _rng.choice convert them to arrays
+    policy_types = [_POLICY_TYPES[i] for i in _rng.integers(0, len(_POLICY_TYPES), n).tolist()]
+    claim_types = [_CLAIM_TYPES[i] for i in _rng.integers(0, len(_CLAIM_TYPES), n).tolist()]
+    amounts = np.round(_rng.uniform(100, 20000, n), 2).tolist()
+    frauds = (_rng.random(n) < 0.05).tolist() # 5% chance of being fraud
+    # One timestamp per batch is precise enough and saves a clock call per record
+    timestamp = datetime.now()
+    # The simulator runs for days, so roll the claim date window forward at midnight
+    global _TODAY, _CLAIM_DATES
+    if timestamp.date() != _TODAY:
+        _TODAY = timestamp.date()
+        _CLAIM_DATES = _claim_dates_until(_TODAY)
+    claim_dates = [_CLAIM_DATES[offset] for offset in _rng.integers(0, _SPAN + 1, n).tolist()]
+
+    customers, claims = [], []
+    for customer_id, claim_id, policy_type, claim_type, claim_date, amount, is_fraud in zip(
+        customer_ids, claim_ids, policy_types, claim_types, claim_dates, amounts, frauds
+    ):
+        customers.append(RawBSONDocument(encode({
+            "customer_id": customer_id,
+            "name": _fake_name(),
+            "state": _fake_state(),
+            "policy_type": policy_type,
+            "timestamp": timestamp # Add current server timestamp for context
+        })))
+        claims.append(RawBSONDocument(encode({
+            "claim_id": claim_id,
+            "customer_id": customer_id, # Link back to the customer
+            "date": claim_date,
+            "amount": amount,
+            "claim_type": claim_type,
+            "is_fraud": is_fraud,
+            "status": "Submitted" # Initial status
+        })))
+
+    logger.debug("Generated batch of %d customer/claim pairs", n)
+    return customers, claims
+
+async def insert_batch(client, customers_col, claims_col, customers, claims):
+    """
+    Inserts a batch of customers and claims with a single unordered client-level bulk_write.
+    
+    MongoClient.bulk_write (MongoDB 8.0+) sends inserts for both namespaces in one
+    command, and unordered writes keep going past individual failures (e.g. a
+    duplicate ID rejected by the unique index), so one collision does not discard
+    the rest of the batch.
     
-    customer = {
-        "customer_id": customer_id,
-        "name": fake.name(),
-        "state": fake.state_abbr(),
-        "policy_type": random.choice(["Auto", "Home", "Health"]),
-        "timestamp": datetime.now() # Add current server timestamp for context
-    }
+    Args:
+        client (pymongo.AsyncMongoClient): The client used to issue the bulk write.
+        customers_col (pymongo.asynchronous.collection.AsyncCollection): The customers collection.
+        claims_col (pymongo.asynchronous.collection.AsyncCollection): The claims collection.
+        customers (list): The customer documents to insert.
+        claims (list): The claim documents to insert.
+        
+    Returns:
+        tuple: (customers_inserted, claims_inserted)
+    """
+    # Customers go first so every claim follows the customer it references
+    models = [InsertOne(customer, namespace=customers_col.full_name) for customer in customers]
+    models += [InsertOne(claim, namespace=claims_col.full_name) for claim in claims]
+    if not models:
+        return 0, 0
+    try:
+        await client.bulk_write(models, ordered=False)
+        return len(customers), len(claims)
+    except pymongo.errors.ClientBulkWriteException as cbwe:
+        if cbwe.error is not None:
+            # A top-level failure (e.g. network error after the retry) leaves the outcome
+            # unknown, so count the whole batch as not inserted
+            logger.error(f"Bulk write of {len(models)} document(s) failed; counting the batch as not inserted. Error: {cbwe.error}")
+            return 0, 0
+
+        write_errors = cbwe.write_errors or []
+        duplicates = sum(1 for error in write_errors if error.get("code") == 11000)
+        if duplicates:
+            logger.warning(f"Duplicate key error detected for {duplicates} document(s) (likely ID collision). Skipped those documents.")
+        if len(write_errors) > duplicates:
+            logger.error(f"{len(write_errors) - duplicates} document(s) failed to insert. First error: {write_errors[0].get('errmsg')}")
+        if cbwe.write_concern_errors:
+            logger.error(f"MongoDB Write Concern Error: Data insertion might not be fully confirmed. Error: {cbwe.write_concern_errors}")
 
-    claim = {
-        "claim_id": f"CLM-{random.randint(1000, 9999)}",
-        "customer_id": customer_id, # Link back to the customer
-        "date": fake.date_between(start_date='-1y', end_date='today').isoformat(),
-        "amount": round(random.uniform(100, 20000), 2),
-        "claim_type": random.choice(["Accident", "Theft", "Fire", "Liability"]),
-        "is_fraud": random.random() < 0.05, # 5% chance of being fraud
-        "status": "Submitted" # Initial status
-    }
+        # The server's insert count is authoritative; the failed model indexes only
+        # split it between namespaces (indexes below len(customers) are customers)
+        partial_result = cbwe.partial_result
+        inserted = partial_result.inserted_count if partial_result is not None else 0
+        failed_customers = sum(1 for error in write_errors if error.get("idx", 0) < len(customers))
+        customers_inserted = min(len(customers) - failed_customers, inserted)
+        return customers_inserted, inserted - customers_inserted
+
+async def write_batch(semaphore, client, customers_col, claims_col, customers, claims):
+    """
+    Writes one batch in the background and releases its concurrency slot when done.
+    
+    The caller acquires the semaphore before scheduling this coroutine, so the
+    producer stops generating once `concurrency` batches are already in flight.
     
-    logger.debug(f"Generated data for CUST:{customer_id} and CLM:{claim['claim_id']}")
-    return customer, claim
+    Returns:
+        tuple: (customers_inserted, claims_inserted)
+    """
+    try:
+        customers_inserted, claims_inserted = await insert_batch(client, customers_col, claims_col, customers, claims)
+        logger.info("-> Inserted batch of %d claims for %d customers", claims_inserted, customers_inserted)
+        return customers_inserted, claims_inserted
+    except Exception as insert_e:
+        logger.error(f"Failed to insert data into MongoDB due to an unknown error: {insert_e}")
+        return 0, 0
+    finally:
+        semaphore.release()
 
-def run_simulation(customers_col, claims_col, sleep_time):
+async def run_simulation(client, customers_col, claims_col, target_rate, batch_size, concurrency, worker_id=0):
     """
-    Runs the infinite loop to generate and insert data into MongoDB.
+    Runs the infinite loop to generate data and insert it into MongoDB with
+    up to `concurrency` batch writes in flight at once.
+    
+    The logged counts are this worker's own inserts since startup. Worker 0 also
+    reports the collection sizes at startup, which every worker would otherwise repeat.
+    
+    Batches are paced against a monotonic schedule of `target_rate` records per
+    second, so a slow write delays only that batch and the loop catches up afterwards.
     """
-    logger.info(f"Starting real-time simulation. Inserting data every {sleep_time} seconds...")
+    # Bind the logger methods locally so the loop does fast local lookups
+    log_info = logger.info
+    log_err = logger.error
+    log_critical = logger.critical
+
+    log_info(f"Worker {worker_id}: Starting real-time simulation. Inserting batches of {batch_size} at {target_rate:g} records/s with up to {concurrency} concurrent writes...")
+
+    if worker_id == 0:
+        log_info(
+            "Collections held %d customers and %d claims at startup",
+            await customers_col.estimated_document_count(),
+            await claims_col.estimated_document_count(),
+        )
+
+    # Other workers write to the same collections, so track only this worker's inserts
+    customer_count = 0
+    claim_count = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    in_flight = set()
+    batch_interval = batch_size / target_rate
+    next_tick = time.monotonic()
     try:
         while True:
-            # 1. Generate Data
-            customer, claim = generate_insurance_data()
+            # 1. Generate a full batch of data
+            customers, claims = generate_batch(batch_size, worker_id)
 
-            # 2. Insert into MongoDB
-            try:
-                # Insert customer first
-                customers_col.insert_one(customer)
-                claims_col.insert_one(claim)
-                
-                # 3. Log success
-                logger.info(f"-> Inserted claim {claim['claim_id']} for customer {customer['customer_id']} ({customer['policy_type']})")
-
-                # 4. Calculate and log the current counts in both collections
-                customer_count = customers_col.count_documents({})
-                claim_count = claims_col.count_documents({})
-                
-                logger.info(f"Customer Count == {customer_count}")
-                logger.info(f"Claim Count == {claim_count}")
+            # 2. Hand the batch to a background write once a slot is free
+            await semaphore.acquire()
+            in_flight.add(asyncio.create_task(
+                write_batch(semaphore, client, customers_col, claims_col, customers, claims)
+            ))
 
-            except pymongo.errors.DuplicateKeyError as dke:
-                logger.warning(f"Duplicate key error detected (likely customer ID collision). Skipping insertion. Error: {dke}")
-            except pymongo.errors.WriteConcernError as wce:
-                logger.error(f"MongoDB Write Concern Error: Data insertion might not be fully confirmed. Error: {wce}")
-            except Exception as insert_e:
-                logger.error(f"Failed to insert data into MongoDB due to an unknown error: {insert_e}")
+            # 3. Tally the batches that have completed since the last cycle
+            done = {task for task in in_flight if task.done()}
+            in_flight -= done
+            for task in done:
+                customers_inserted, claims_inserted = task.result()
+                customer_count += customers_inserted
+                claim_count += claims_inserted
 
+            # 4. Log how many records this worker has inserted so far
+            log_info("Worker %d: Inserted %d customers and %d claims so far", worker_id, customer_count, claim_count)
 
-            # 5. Wait for the next cycle
-            time.sleep(sleep_time)
+            # 5. Wait for the next scheduled batch without blocking the in-flight writes.
+            # When behind schedule, sleep(0) still yields so the writes can progress
+            next_tick += batch_interval
+            await asyncio.sleep(max(next_tick - time.monotonic(), 0))
 
-    except KeyboardInterrupt:
-        logger.info("Simulation stopped by user (Ctrl+C). Exiting.")
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        # The task is cancelled on shutdown; wait for the in-flight writes to finish
+        try:
+            for customers_inserted, claims_inserted in await asyncio.gather(*in_flight):
+                customer_count += customers_inserted
+                claim_count += claims_inserted
+            log_info(f"Worker {worker_id}: Drained in-flight batches. Inserted {customer_count} customers and {claim_count} claims in total")
+        except Exception as drain_e:
+            log_err(f"Failed to drain in-flight batches on shutdown: {drain_e}")
+        log_info(f"Worker {worker_id}: Simulation stopped. Exiting.")
+    except Exception as e:
+        log_critical(f"Worker {worker_id}: A critical error occurred during the simulation loop: {e}")
+
+async def run_pipeline(mongo_uri, db_name, target_rate, batch_size, concurrency, max_pool, min_pool, write_concern, worker_id=0):
+    """
+    Connects to MongoDB and runs the simulation on a single event loop, closing the client on exit.
+    
+    SIGTERM cancels the simulation task so it can finish its in-flight batches before exiting,
+    and so does the parent process exiting without stopping the workers first.
+    """
+    loop = asyncio.get_running_loop()
+    task = asyncio.current_task()
+
+    def stop_on_parent_exit(sentinel):
+        # The sentinel stays readable once the parent is gone, so only cancel once
+        loop.remove_reader(sentinel)
+        logger.warning("Parent process exited. Stopping the simulation.")
+        task.cancel()
+
+    try:
+        loop.add_signal_handler(signal.SIGTERM, task.cancel)
+        parent = multiprocessing.parent_process()
+        if parent is not None:
+            loop.add_reader(parent.sentinel, stop_on_parent_exit, parent.sentinel)
+    except NotImplementedError:
+        # Signal handlers are unavailable on Windows event loops
+        pass
+
+    client, customers_col, claims_col = await setup_mongo_connection(mongo_uri, db_name, max_pool, min_pool, write_concern)
+    try:
+        await run_simulation(client, customers_col, claims_col, target_rate, batch_size, concurrency, worker_id)
+    finally:
+        await client.close()
+
+def run_worker(worker_id, log_queue, mongo_uri, db_name, target_rate, batch_size, concurrency, max_pool, min_pool, write_concern):
+    """
+    Entry point of a producer process: runs its own event loop and MongoDB client.
+    """
+    # The parent process coordinates shutdown, so ignore the terminal's Ctrl+C and stop on SIGTERM instead
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    global logger, _rng
+    # Forward records to the main process, which owns the log file
+    logger = setup_worker_logger(log_queue)
+
+    # Forked workers inherit the parent's RNG state; reseed so each produces distinct data
+    _rng = np.random.default_rng()
+    fake.seed_instance()
+    try:
+        asyncio.run(run_pipeline(mongo_uri, db_name, target_rate, batch_size, concurrency, max_pool, min_pool, write_concern, worker_id))
+    except asyncio.CancelledError:
+        # Stopped outside the simulation loop, e.g. while connecting or closing the client
+        logger.info(f"Worker {worker_id} stopped during startup/shutdown.")
+    except pymongo.errors.ConnectionFailure:
+        # setup_mongo_connection already logged the critical details
+        logger.critical(f"Worker {worker_id} terminated due to MongoDB connection failure.")
     except Exception as e:
-        logger.critical(f"A critical error occurred during the simulation loop: {e}")
+        logger.critical(f"Worker {worker_id} terminated due to an unhandled error: {e}")
+
+def run_workers(workers, mongo_uri, db_name, target_rate, batch_size, concurrency, max_pool, min_pool, write_concern):
+    """
+    Starts one producer process per worker and waits for them, stopping them all on Ctrl+C or SIGTERM.
+    
+    Each worker generates data on its own core and writes through its own connection pool,
+    pacing itself at an equal share of `target_rate`. `min_pool` is the number of ready
+    connections across all workers, so it is split between them as well.
+    """
+    worker_min_pool = min_pool // workers
+    processes = [
+        multiprocessing.Process(
+            target=run_worker,
+            args=(worker_id, get_log_queue(), mongo_uri, db_name, target_rate / workers, batch_size, concurrency, max_pool, worker_min_pool, write_concern),
+            name=f"simulator-worker-{worker_id}",
+        )
+        for worker_id in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    logger.info(f"Started {workers} simulator worker process(es).")
+
+    def stop_on_sigterm(signum, frame):
+        raise KeyboardInterrupt
+
+    # Installed after the workers start so they don't inherit it; treats SIGTERM
+    # (kill, docker stop, a supervisor) like Ctrl+C instead of orphaning the workers
+    signal.signal(signal.SIGTERM, stop_on_sigterm)
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        # Supervisors may resend SIGTERM; ignore it so the workers get to finish
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        logger.info("Simulation stopped (Ctrl+C or SIGTERM). Waiting for workers to finish in-flight batches...")
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
 
 
 if __name__ == "__main__":
-    # 1. Initialize Logger (This also triggers the log file cleanup)
+    # 1. Initialize Logger (worker processes log through its queue)
     logger = setup_logger()
     logger.info("--- Insurance Data Simulator Application Starting ---")
     
     try:
         # 2. Load configuration
-        mongo_uri, sleep_time, db_name = load_configuration()
-        
-        # 3. Set up connection
-        customers_col, claims_col = setup_mongo_connection(mongo_uri, db_name)
+        mongo_uri, target_rate, db_name, batch_size, concurrency, workers, max_pool, min_pool, write_concern = load_configuration()
         
-        # 4. Run the loop
-        run_simulation(customers_col, claims_col, sleep_time)
+        # 3. Run the producer processes, each with its own connection and event loop
+        run_workers(workers, mongo_uri, db_name, target_rate, batch_size, concurrency, max_pool, min_pool, write_concern)
         
     except ValueError as ve:
         # Catch configuration errors and log them as critical
         logger.critical(f"Application terminated due to Configuration Error: {ve}")
-    except pymongo.errors.ConnectionFailure:
-        # Catch connection failures (setup_mongo_connection already logged the critical details)
-        logger.critical("Application terminated due to MongoDB connection failure.")
+    except KeyboardInterrupt:
+        logger.info("Simulation stopped by user (Ctrl+C). Exiting.")
     except Exception as e:
         logger.critical(f"A fatal and unhandled error occurred during application setup: {e}")
     finally:
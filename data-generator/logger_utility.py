@@ -1,28 +1,72 @@
+import atexit
 import logging
 import logging.handlers
+import multiprocessing
 import os
-from datetime import datetime, timedelta
-import shutil
+import time
 
 # --- Configuration Constants ---
 LOG_DIR = "logs"
-ARCHIVE_DIR = os.path.join(LOG_DIR, "archive")
-LOG_FILENAME = f"simulator_{datetime.now().strftime('%Y-%m-%d')}.log"
+LOG_FILENAME = "simulator.log"
 LOG_FILEPATH = os.path.join(LOG_DIR, LOG_FILENAME)
 LOG_LEVEL = logging.INFO # Set default logging level
+LOG_MAX_BYTES = 50 * 1024 * 1024 # Roll over to a new file after 50 MiB
+LOG_BACKUP_COUNT = 7 # Keep this many rolled-over files, deleting the oldest
+LOG_BUFFER_SIZE = 1 << 20 # 1 MiB write buffer for the log file
+LOG_FLUSH_INTERVAL = 5 # Seconds between flushes of the write buffer, so the file never lags far behind
 
-def setup_logger():
+# Lean format for the high-volume simulator logs; the verbose one adds the
+# source location and is only used when LOG_LEVEL is DEBUG
+LOG_FORMAT = '%(asctime)s | %(levelname)-8s | %(message)s'
+VERBOSE_LOG_FORMAT = '%(asctime)s | %(levelname)-8s | %(module)s.%(funcName)s:%(lineno)d | %(message)s'
+
+# Background listener that drains queued records to the file and console handlers
+_listener = None
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
     """
-    Sets up a centralized logger that writes to a daily file and the console.
-    
-    Returns:
-        logging.Logger: The configured logger instance.
+    A RotatingFileHandler that writes through a large buffer instead of flushing every record.
+
+    The stock handler flushes after each record and seeks the file to check its
+    size, which costs several syscalls per line. This one tracks the file size
+    itself, so the buffer is only written out when it fills, at most
+    LOG_FLUSH_INTERVAL seconds after the last flush, on rollover and on close.
+    The file is opened in binary mode and each record is encoded once, which both
+    sizes it in bytes and produces what is written.
     """
-    # 1. Create Directories if they don't exist
-    os.makedirs(LOG_DIR, exist_ok=True)
-    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    _size = 0
+    _last_flush = 0.0
 
-    # 2. Configure Logger
+    def _open(self):
+        stream = open(self.baseFilename, 'ab', buffering=LOG_BUFFER_SIZE)
+        self._size = os.fstat(stream.fileno()).st_size
+        self._last_flush = time.monotonic()
+        return stream
+
+    def emit(self, record):
+        try:
+            msg = (self.format(record) + self.terminator).encode(self.encoding or 'utf-8', self.errors or 'strict')
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None: # delay was set...
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += len(msg)
+            now = time.monotonic()
+            if now - self._last_flush >= LOG_FLUSH_INTERVAL:
+                self.stream.flush()
+                self._last_flush = now
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+def _configure_logger():
+    """
+    Returns the shared simulator logger, cleared of any existing handlers.
+    """
     logger = logging.getLogger('InsuranceSimulatorLogger')
     logger.setLevel(LOG_LEVEL)
 
@@ -30,61 +74,108 @@ def setup_logger():
     if logger.hasHandlers():
         logger.handlers.clear()
 
+    if LOG_LEVEL > logging.DEBUG:
+        # Skip the caller-frame lookup on every record, as recommended by the
+        # "Optimization" section of the logging HOWTO; the lean format doesn't use it
+        logging._srcfile = None
+    return logger
+
+def setup_logger():
+    """
+    Sets up a centralized logger that writes to a size-rotated file and the console.
+
+    The logger itself only enqueues records; a QueueListener thread does the
+    actual file and console I/O so logging never blocks the caller. The queue is
+    a multiprocessing queue, so worker processes log through the same listener
+    via setup_worker_logger() and only this process ever writes or rotates the file.
+
+    Returns:
+        logging.Logger: The configured logger instance.
+    """
+    # 1. Create Directories if they don't exist
+    os.makedirs(LOG_DIR, exist_ok=True)
+
+    # 2. Configure Logger
+    logger = _configure_logger()
+    shutdown_logger()
+
     # 3. Define Log Format
     formatter = logging.Formatter(
-        '%(asctime)s | %(levelname)-8s | %(module)s.%(funcName)s:%(lineno)d | %(message)s',
+        VERBOSE_LOG_FORMAT if LOG_LEVEL <= logging.DEBUG else LOG_FORMAT,
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
-    # 4. File Handler (writes logs to the daily file)
-    file_handler = logging.FileHandler(LOG_FILEPATH, encoding='utf-8')
+    # 4. File Handler (writes logs to a buffered file that rotates by size)
+    file_handler = BufferedRotatingFileHandler(
+        LOG_FILEPATH,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding='utf-8',
+        delay=True
+    )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     # 5. Stream Handler (writes logs to the console)
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
-    logger.addHandler(stream_handler)
-    
-    # Run cleanup immediately on setup
-    cleanup_old_logs()
+
+    # 6. Queue Handler (hands records to the listener thread that owns the handlers above)
+    global _listener
+    log_queue = multiprocessing.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    _listener.start()
+
+    # Registered once the multiprocessing queue exists, so that (atexit being LIFO)
+    # the listener drains before multiprocessing's own exit handler closes the queue
+    atexit.unregister(shutdown_logger)
+    atexit.register(shutdown_logger)
 
     return logger
 
-def cleanup_old_logs(days_to_keep=7):
+def get_log_queue():
     """
-    Archives log files older than a specified number of days (default 7).
+    Returns the queue drained by the listener started in setup_logger(), for passing to worker processes.
     """
-    cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-    
-    for filename in os.listdir(LOG_DIR):
-        if filename.endswith(".log"):
-            filepath = os.path.join(LOG_DIR, filename)
-            
-            # Skip the currently active log file
-            if filename == LOG_FILENAME:
-                continue
-                
-            try:
-                # Extract file creation time
-                file_time = datetime.fromtimestamp(os.path.getmtime(filepath))
-                
-                if file_time < cutoff_date:
-                    # Archive the old file
-                    archive_path = os.path.join(ARCHIVE_DIR, filename)
-                    shutil.move(filepath, archive_path)
-                    print(f"Archived old log file: {filename}")
-                    
-            except Exception as e:
-                # Log this cleanup error internally
-                logging.getLogger('InsuranceSimulatorLogger').error(f"Error during log cleanup for {filename}: {e}")
-
-# Call setup_logger once in the module to configure the basic logging 
-# for any errors that might occur during module import/cleanup.
+    return _listener.queue if _listener is not None else None
+
+def setup_worker_logger(log_queue):
+    """
+    Sets up the logger in a worker process to forward every record to the main process's listener.
+
+    Args:
+        log_queue (multiprocessing.Queue): The queue returned by get_log_queue() in the main process.
+
+    Returns:
+        logging.Logger: The configured logger instance.
+    """
+    global _listener
+    # A forked worker inherits the parent's listener object but not its thread;
+    # drop it so shutdown_logger() never sends a stop sentinel to the parent
+    _listener = None
+
+    logger = _configure_logger()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    return logger
+
+def shutdown_logger():
+    """
+    Stops the listener thread after it has written every queued record, then
+    flushes the buffered log file. Registered with atexit by setup_logger().
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.flush()
+        _listener = None
+
+# Call setup_logger once in the module to configure the basic logging
+# for any errors that might occur during module import.
 # The main application will call setup_logger() explicitly.
 if __name__ == '__main__':
     # Example usage if this file is run directly
     temp_logger = setup_logger()
     temp_logger.info("Test log entry.")
-    temp_logger.warning("Old logs should be archived now.")
+    temp_logger.warning("Logs roll over to simulator.log.1 once they reach LOG_MAX_BYTES.")
     temp_logger.debug("This debug message should not appear if LOG_LEVEL is INFO.")